@@ -0,0 +1,34 @@
+"""
+JSON helpers with an optional orjson fast path.
+
+orjson ships with the ``worker`` extra.  When it is installed, Claude's
+stream-json lines and SSE payloads are decoded and encoded several times
+faster than with the stdlib ``json`` module; otherwise ``json`` is used.
+Both ``dumps`` paths emit the same compact text.
+
+``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``, so callers
+catch ``json.JSONDecodeError`` on either path.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj: Any) -> str:
+        """Encode *obj* as compact JSON text."""
+        # Non-str dict keys are stringified, as json.dumps does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    loads = json.loads
+
+    def dumps(obj: Any) -> str:
+        """Encode *obj* as compact JSON text."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
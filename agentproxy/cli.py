@@ -29,6 +29,15 @@ class CLI:
     """
     Command-line interface for PA agent.
     """
+
+    # Colored prefix per event source
+    SOURCE_PREFIXES = {
+        "claude":      "\033[35m┃ Claude      ┃\033[0m",  # Magenta
+        "pa":          "\033[36m│ PA          │\033[0m",  # Cyan
+        "pa-thinking": "\033[34m│ 💭 THINKING │\033[0m",  # Blue
+        "pa-to-claude": "\033[32m\033[1m│ PA → Claude │\033[0m",  # Green bold
+        "telemetry":   "\033[2m│ 📊 OTEL     │\033[0m",  # Dim/grey
+    }
     
     def __init__(self):
         self.pa: Optional[PA] = None
@@ -420,8 +429,8 @@ Examples:
         context_dir = self._get_saved_contextdir()
         
         # Create working directory if it doesn't exist
-        if not os.path.exists(working_dir):
-            os.makedirs(working_dir)
+        if not os.path.isdir(working_dir):
+            os.makedirs(working_dir, exist_ok=True)
             print(f"Created working directory: {working_dir}")
         
         try:
@@ -473,14 +482,7 @@ Examples:
                 source = event.metadata.get("source", "pa") if event.metadata else "pa"
                 
                 # Colored prefix based on source
-                SOURCE_PREFIXES = {
-                    "claude":      "\033[35m┃ Claude      ┃\033[0m",  # Magenta
-                    "pa":          "\033[36m│ PA          │\033[0m",  # Cyan
-                    "pa-thinking": "\033[34m│ 💭 THINKING │\033[0m",  # Blue
-                    "pa-to-claude": "\033[32m\033[1m│ PA → Claude │\033[0m",  # Green bold
-                    "telemetry":   "\033[2m│ 📊 OTEL     │\033[0m",  # Dim/grey
-                }
-                prefix = SOURCE_PREFIXES.get(source, SOURCE_PREFIXES["pa"])
+                prefix = self.SOURCE_PREFIXES.get(source, self.SOURCE_PREFIXES["pa"])
                 
                 # Color content based on event type
                 if event.event_type == EventType.ERROR:
@@ -11,6 +11,7 @@ Exports:
     is_celery_available: Returns True if celery and redis are importable.
 """
 
+from .celery_app import celery_disabled
 from .coordinator import Coordinator
 
 
@@ -19,8 +20,12 @@ def is_celery_available() -> bool:
 
     Returns True only if both ``celery`` and ``redis`` can be imported.
     Does NOT check whether a Redis server is actually reachable -- that
-    is deferred to connection time.
+    is deferred to connection time.  Always False when
+    AGENTPROXY_CELERY_DISABLED=1.
     """
+    if celery_disabled():
+        return False
+
     try:
         import celery  # noqa: F401
         import redis  # noqa: F401
@@ -8,14 +8,160 @@ coordination. Uses Redis as both broker and result backend.
 Usage:
     from agentproxy.coordinator.celery_app import make_celery_app
     app = make_celery_app()
+
+``make_celery_app()`` without arguments returns a process-wide shared app,
+so the worker CLI and the task module register against the same instance.
+
+Set ``AGENTPROXY_CELERY_DISABLED=1`` to skip importing Celery entirely:
+``make_celery_app()`` then returns a stub whose tasks raise on submission.
 """
 
 import os
+import threading
+
+# Registered name of the orjson kombu serializer (see _register_orjson)
+ORJSON_SERIALIZER = "orjson"
+
+# Shared app returned by make_celery_app() when called without overrides
+_APP = None
+_APP_LOCK = threading.Lock()
+
+
+def celery_disabled() -> bool:
+    """Return True if AGENTPROXY_CELERY_DISABLED=1 turns Celery off."""
+    return os.getenv("AGENTPROXY_CELERY_DISABLED", "0") == "1"
+
+
+class CeleryDisabledError(RuntimeError, AttributeError):
+    """Raised when a Celery feature is used with AGENTPROXY_CELERY_DISABLED=1.
+
+    Also an AttributeError, so ``hasattr()``/``getattr(..., default)`` on the
+    stub app behave normally instead of raising.
+    """
+
+
+class _NullApp:
+    """Stand-in app used when Celery is disabled.
+
+    Task decorators still work (so modules defining tasks import cleanly),
+    but submitting a task or touching any other app attribute raises
+    :class:`CeleryDisabledError`.
+    """
+
+    def task(self, *args, **kwargs):
+        def decorator(func):
+            func.apply_async = func.delay = _raise_disabled
+            return func
+        return decorator
+
+    def __getattr__(self, name):
+        _raise_disabled()
+
+
+def _raise_disabled(*args, **kwargs):
+    raise CeleryDisabledError(
+        "Celery is disabled (AGENTPROXY_CELERY_DISABLED=1); "
+        "unset it to dispatch tasks to workers"
+    )
+
+
+def _register_orjson() -> bool:
+    """Register an orjson-backed JSON encoder with kombu if orjson is installed.
+
+    orjson is a C extension that encodes the dict-heavy milestone payloads
+    several times faster than the stdlib ``json`` module.  Its output is
+    plain JSON, so it is registered under ``application/json`` with no
+    decoder of its own: kombu's json decoder reads the bodies, and peers
+    without orjson decode them unchanged.
+
+    Returns:
+        True if the encoder is available, False to fall back to ``json``.
+    """
+    from .._json import dumps, orjson
+
+    if orjson is None:
+        return False
+
+    from kombu.serialization import register
+
+    register(
+        ORJSON_SERIALIZER,
+        dumps,
+        None,
+        content_type="application/json",
+        content_encoding="utf-8",
+    )
+    return True
+
+
+def _task_compression():
+    """Pick the codec for task and result bodies.
+
+    Milestone payloads are mostly repetitive event text, so they shrink
+    several-fold.  gzip is the default because every kombu install can
+    decode it.  AGENTPROXY_TASK_COMPRESSION overrides the choice: ``zstd``
+    is faster but needs ``zstandard`` (not part of the ``worker`` extra)
+    installed on the coordinator and every worker; ``none`` disables
+    compression.
+    """
+    choice = os.getenv("AGENTPROXY_TASK_COMPRESSION")
+    if choice:
+        return None if choice.lower() == "none" else choice
+    return "gzip"
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer env var, falling back to *default* if unset or invalid."""
+    try:
+        return int(os.getenv(name, str(default)))
+    except (ValueError, TypeError):
+        return default
 
 
 def make_celery_app(
     broker_url: str = None,
     result_backend: str = None,
+):
+    """Return a configured Celery app for agentproxy task dispatch.
+
+    Called without arguments, the app is built once and shared by every
+    caller in the process.  Passing an explicit *broker_url* or
+    *result_backend* always builds a new, unshared app.  When
+    AGENTPROXY_CELERY_DISABLED=1, a stub app is returned and Celery is
+    never imported.
+
+    Args:
+        broker_url: Redis URL for the Celery broker.
+        result_backend: Redis URL for storing task results.
+
+    Returns:
+        A configured Celery application instance.
+    """
+    global _APP
+
+    if celery_disabled():
+        return _NullApp()
+
+    if broker_url or result_backend:
+        return _build_celery_app(broker_url, result_backend)
+
+    if _APP is None:
+        with _APP_LOCK:
+            if _APP is None:
+                _APP = _build_celery_app()
+    return _APP
+
+
+def reset_celery_app() -> None:
+    """Drop the shared app so the next call rebuilds it (for testing)."""
+    global _APP
+    with _APP_LOCK:
+        _APP = None
+
+
+def _build_celery_app(
+    broker_url: str = None,
+    result_backend: str = None,
 ):
     """Create a configured Celery app for agentproxy task dispatch.
 
@@ -25,6 +171,14 @@ def make_celery_app(
         result_backend: Redis URL for storing task results.
             Defaults to AGENTPROXY_RESULT_BACKEND env var or redis://localhost:6379/1.
 
+    Environment:
+        AGENTPROXY_CELERY_POOL: Worker pool implementation (default: prefork).
+            Milestones run a full PA session per task, so prefork stays the
+            default; gevent/eventlet can be selected when installed.
+        AGENTPROXY_BROKER_POOL_LIMIT: Max pooled broker connections (default: 10).
+        AGENTPROXY_TASK_COMPRESSION: Task/result codec (default: gzip;
+            ``zstd`` when every process has ``zstandard``; ``none`` disables).
+
     Returns:
         A configured Celery application instance.
     """
@@ -37,6 +191,9 @@ def make_celery_app(
         "AGENTPROXY_RESULT_BACKEND", "redis://localhost:6379/1"
     )
 
+    serializer = ORJSON_SERIALIZER if _register_orjson() else "json"
+    compression = _task_compression()
+
     app = Celery(
         "agentproxy",
         broker=broker_url,
@@ -46,16 +203,37 @@ def make_celery_app(
     app.conf.update(
         # One task at a time per worker (sequential milestone execution)
         worker_concurrency=1,
+        worker_pool=os.getenv("AGENTPROXY_CELERY_POOL", "prefork"),
+        # Reuse broker connections instead of reconnecting per publish/poll
+        broker_pool_limit=_env_int("AGENTPROXY_BROKER_POOL_LIMIT", 10),
+        broker_connection_retry_on_startup=True,
+        # Keep idle Redis sockets alive across long-running milestones
+        broker_transport_options={
+            "socket_keepalive": True,
+            "health_check_interval": 30,
+        },
+        # The Redis result backend reads these settings, not its
+        # result_backend_transport_options
+        redis_socket_keepalive=True,
+        redis_backend_health_check_interval=30,
+        redis_retry_on_timeout=True,
         # Acknowledge after task completes (not on receive) for reliability
         task_acks_late=True,
         # Re-queue task if worker dies mid-execution
         task_reject_on_worker_lost=True,
+        # Don't store results unless a task opts in with ignore_result=False
+        # (run_milestone does: the coordinator waits on it)
+        task_ignore_result=True,
         # Results expire after 1 hour
         result_expires=3600,
-        # Serialize as JSON for cross-language compatibility
-        task_serializer="json",
-        result_serializer="json",
+        # Serialize as JSON, encoded by orjson when installed; the bodies
+        # are application/json either way, so mixed installs interoperate
+        task_serializer=serializer,
+        result_serializer=serializer,
         accept_content=["json"],
+        # Compress task and result bodies on the Redis wire
+        task_compression=compression,
+        result_compression=compression,
         # Route all agentproxy tasks to configurable queue
         task_routes={
             "agentproxy.run_milestone": {
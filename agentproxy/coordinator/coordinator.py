@@ -9,13 +9,15 @@ The generator-based interface is preserved: ``run_task_multi_worker()``
 yields ``OutputEvent`` objects exactly like the single-worker path.
 """
 
+import queue
 import re
+import threading
 import time
 from typing import TYPE_CHECKING, Any, Dict, Generator, List
 
 from ..models import EventType, OutputEvent
 from ..telemetry import get_telemetry
-from .models import MilestoneResult, deserialize_output_event
+from .models import PROGRESS_STATE, MilestoneResult, deserialize_output_event
 
 if TYPE_CHECKING:
     from ..pa import PA
@@ -27,6 +29,14 @@ _POLL_INTERVAL = 2.0
 # Maximum time to wait for a single milestone (seconds)
 _MILESTONE_TIMEOUT = 1800  # 30 minutes
 
+# Markdown checklist item: "- [ ] description" (also "* [x] ...")
+_CHECKLIST_RE = re.compile(r"^\s*[-*]\s*\[[ x]?\]\s*(.+)$", re.IGNORECASE)
+
+# Sentinels placed on the progress queue once the result has arrived, or
+# once waiting for it with on_message has failed
+_RESULT_READY = object()
+_WAIT_FAILED = object()
+
 
 class Coordinator:
     """Orchestrate task decomposition and sequential milestone dispatch.
@@ -105,8 +115,8 @@ class Coordinator:
                 queue=self.queue,
             )
 
-            # Poll and yield progress events
-            yield from self._poll_result(async_result, i, len(milestones))
+            # Relay worker events as they stream in
+            streamed = yield from self._poll_result(async_result, i, len(milestones))
 
             # Collect result and update context
             raw = async_result.get(timeout=_MILESTONE_TIMEOUT)
@@ -117,8 +127,8 @@ class Coordinator:
                 telemetry.milestones_completed.add(1, {"status": result.status})
                 telemetry.milestone_duration.record(result.duration)
 
-            # Replay worker events into the parent generator
-            for evt_dict in result.events:
+            # Replay any worker events that were not streamed
+            for evt_dict in result.events[streamed:]:
                 yield deserialize_output_event(evt_dict)
 
             yield self._emit(
@@ -157,8 +167,7 @@ class Coordinator:
         """
         milestones: List[str] = []
         for line in breakdown_text.splitlines():
-            # Match markdown checklist items: - [ ] description
-            match = re.match(r"^\s*[-*]\s*\[[ x]?\]\s*(.+)$", line, re.IGNORECASE)
+            match = _CHECKLIST_RE.match(line)
             if match:
                 text = match.group(1).strip()
                 if text:
@@ -167,23 +176,97 @@ class Coordinator:
 
     def _poll_result(
         self, async_result, milestone_index: int, total: int
-    ) -> Generator[OutputEvent, None, None]:
-        """Poll a Celery AsyncResult, yielding progress events."""
+    ) -> Generator[OutputEvent, None, int]:
+        """Wait for a Celery AsyncResult, yielding worker events as they arrive.
+
+        A background thread blocks in ``AsyncResult.get()`` with an
+        ``on_message`` callback, which receives every ``PROGRESS`` update
+        published by ``run_milestone``.  Their events are yielded here in
+        order; a heartbeat is yielded every ``_POLL_INTERVAL`` seconds of
+        silence.
+
+        Updates may arrive more than once (the Redis backend re-sends the
+        last state after a reconnect) or not at all.  Each carries the
+        index of its first event, so repeats are skipped and streaming
+        stops at the first gap.  If the backend cannot deliver updates,
+        this falls back to polling ``ready()``.
+
+        Returns:
+            The number of leading worker events yielded, so the caller can
+            replay only the remainder from the final result.
+        """
+        messages: "queue.Queue[Any]" = queue.Queue()
+
+        def _wait() -> None:
+            try:
+                async_result.get(
+                    timeout=_MILESTONE_TIMEOUT,
+                    on_message=messages.put,
+                    propagate=False,
+                )
+            except Exception:
+                # e.g. a backend without on_message support; poll instead
+                messages.put(_WAIT_FAILED)
+            else:
+                messages.put(_RESULT_READY)
+
+        threading.Thread(target=_wait, daemon=True).start()
+
         start = time.time()
+        streamed = 0
+        in_order = True
+        while True:
+            try:
+                message = messages.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                event = self._heartbeat(start, milestone_index, total)
+                yield event
+                if event.event_type is EventType.ERROR:
+                    return streamed
+                continue
+
+            if message is _RESULT_READY:
+                return streamed
+            if message is _WAIT_FAILED:
+                yield from self._poll_ready(async_result, start, milestone_index, total)
+                return streamed
+            if not in_order or message.get("status") != PROGRESS_STATE:
+                continue
+
+            meta = message.get("result") or {}
+            first = meta.get("start")
+            if not isinstance(first, int) or first > streamed:
+                # Updates were lost; the final result fills in the rest
+                in_order = False
+                continue
+            for evt_dict in meta.get("events", [])[streamed - first:]:
+                yield deserialize_output_event(evt_dict)
+                streamed += 1
+
+    def _poll_ready(
+        self, async_result, start: float, milestone_index: int, total: int
+    ) -> Generator[OutputEvent, None, None]:
+        """Poll ``ready()`` until the result arrives, yielding heartbeats."""
         while not async_result.ready():
-            elapsed = time.time() - start
-            if elapsed > _MILESTONE_TIMEOUT:
-                yield self._emit(
-                    f"[Coordinator] Milestone {milestone_index + 1}/{total} timed out after {elapsed:.0f}s",
-                    EventType.ERROR,
-                )
+            event = self._heartbeat(start, milestone_index, total)
+            yield event
+            if event.event_type is EventType.ERROR:
                 return
-            yield self._emit(
-                f"[Coordinator] Milestone {milestone_index + 1}/{total} running ({elapsed:.0f}s elapsed)...",
-                EventType.THINKING,
-            )
             time.sleep(_POLL_INTERVAL)
 
+    def _heartbeat(self, start: float, milestone_index: int, total: int) -> OutputEvent:
+        """Return a running heartbeat, or an ERROR event once the milestone has timed out."""
+        elapsed = time.time() - start
+        if elapsed > _MILESTONE_TIMEOUT:
+            return self._emit(
+                f"[Coordinator] Milestone {milestone_index + 1}/{total} timed out after {elapsed:.0f}s",
+                EventType.ERROR,
+            )
+        return self._emit(
+            f"[Coordinator] Milestone {milestone_index + 1}/{total} running ({elapsed:.0f}s elapsed)...",
+            EventType.THINKING,
+        )
+
     @staticmethod
     def _update_context(
         context: Dict[str, Any], result: MilestoneResult
@@ -12,6 +12,13 @@ from typing import Any, Dict, List, Optional
 
 from ..models import EventType, OutputEvent
 
+# Custom Celery state published by run_milestone while a milestone streams.
+# Its meta is ``{"start": <int>, "events": [<serialized OutputEvent>, ...]}``:
+# the events produced since the previous update, and the index of the first
+# of them in the milestone's event list.  Coordinator._poll_result uses
+# ``start`` to skip re-delivered updates and to stop streaming at a gap.
+PROGRESS_STATE = "PROGRESS"
+
 
 @dataclass
 class MilestoneResult:
@@ -58,13 +65,12 @@ class MilestoneResult:
 
 
 def serialize_output_event(event: OutputEvent) -> Dict[str, Any]:
-    """Convert an OutputEvent to a JSON-serializable dict."""
-    return {
-        "event_type": event.event_type.name,
-        "content": event.content,
-        "timestamp": event.timestamp.isoformat(),
-        "metadata": event.metadata,
-    }
+    """Convert an OutputEvent to a JSON-serializable dict.
+
+    Delegates to :meth:`OutputEvent.to_dict` so the wire format has a
+    single definition.
+    """
+    return event.to_dict()
 
 
 def deserialize_output_event(data: Dict[str, Any]) -> OutputEvent:
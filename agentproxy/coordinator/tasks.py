@@ -10,13 +10,17 @@ through the Redis result backend.
 import time
 from typing import Any, Dict, List
 
+from ..models import ControllerState
 from .celery_app import make_celery_app
-from .models import MilestoneResult, serialize_output_event
+from .models import PROGRESS_STATE, MilestoneResult, serialize_output_event
 
 celery_app = make_celery_app()
 
+# Minimum seconds between PROGRESS updates; events are batched in between
+_PROGRESS_INTERVAL = 1.0
 
-@celery_app.task(bind=True, name="agentproxy.run_milestone")
+
+@celery_app.task(bind=True, name="agentproxy.run_milestone", ignore_result=False)
 def run_milestone(
     self,
     milestone_prompt: str,
@@ -32,6 +36,13 @@ def run_milestone(
     prompt, collects all OutputEvents, and returns a serialized
     :class:`MilestoneResult`.
 
+    Events are also published in ``PROGRESS`` state updates, at most one
+    every ``_PROGRESS_INTERVAL`` seconds, so the coordinator can relay them
+    while the milestone is still running.  Each update carries ``start``,
+    the index of its first event in the milestone, so the coordinator can
+    drop repeats and detect lost updates.  Events still pending when the
+    milestone ends reach the coordinator through the final result.
+
     Args:
         milestone_prompt: The instruction for this milestone.
         working_dir: Filesystem path the worker should operate in.
@@ -66,17 +77,27 @@ def run_milestone(
 
         pa = PA(working_dir=working_dir, session_id=session_id)
 
+        # Only publish progress when running under a worker; direct calls
+        # have no task id to attach state to.
+        publish = self.request.id is not None
+        published = 0
+        last_publish = time.monotonic()
+
         for event in pa.run_task(enriched_prompt):
             events.append(serialize_output_event(event))
-            if event.content:
-                # Collect file-change hints from events
-                pass
+            if publish and time.monotonic() - last_publish >= _PROGRESS_INTERVAL:
+                self.update_state(
+                    state=PROGRESS_STATE,
+                    meta={"start": published, "events": events[published:]},
+                )
+                published = len(events)
+                last_publish = time.monotonic()
 
         # Gather files changed from the PA file tracker
         files_changed = list(set(pa._session_files_changed))
         summary = f"Milestone {milestone_index + 1} completed"
 
-        if pa.state.name == "ERROR":
+        if pa.state is ControllerState.ERROR:
             status = "error"
             summary = f"Milestone {milestone_index + 1} finished with errors"
 
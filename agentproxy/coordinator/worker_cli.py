@@ -14,6 +14,9 @@ Usage:
 import argparse
 import sys
 
+# Accepted --loglevel values (Celery's own names)
+_LOG_LEVELS = ("debug", "info", "warning", "error", "critical")
+
 
 def main(argv=None):
     """Start a Celery worker for agentproxy tasks."""
@@ -31,7 +34,7 @@ def main(argv=None):
     parser.add_argument(
         "--loglevel",
         default="info",
-        choices=["debug", "info", "warning", "error", "critical"],
+        choices=_LOG_LEVELS,
         help="Celery worker log level (default: info)",
     )
     parser.add_argument(
@@ -49,8 +52,20 @@ def main(argv=None):
         queues.append(args.queue)
     queue_str = ",".join(queues)
 
+    # celery_app defers importing Celery itself until an app is built, so
+    # argument errors and the disabled check never pay for it
+    from .celery_app import celery_disabled, make_celery_app
+
+    if celery_disabled():
+        print(
+            "Error: Celery is disabled (AGENTPROXY_CELERY_DISABLED=1).\n"
+            "Unset it to start a worker.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
     try:
-        from .celery_app import make_celery_app
+        app = make_celery_app()
     except ImportError:
         print(
             "Error: celery and redis packages are required.\n"
@@ -59,8 +74,6 @@ def main(argv=None):
         )
         sys.exit(1)
 
-    app = make_celery_app()
-
     # Import tasks so they are registered with the app
     from . import tasks  # noqa: F401
 
@@ -130,6 +130,34 @@ class RealtimeDisplay:
         },
     }
     
+    # Event type labels for SIMPLE mode
+    SIMPLE_LABELS = {
+        EventType.TEXT: "",
+        EventType.THINKING: "[THINK] ",
+        EventType.TOOL_CALL: "[TOOL] ",
+        EventType.TOOL_RESULT: "[RESULT] ",
+        EventType.PROMPT: "[PROMPT] ",
+        EventType.CONFIRMATION: "[CONFIRM] ",
+        EventType.STARTED: "[START] ",
+        EventType.COMPLETED: "[DONE] ",
+        EventType.ERROR: "[ERROR] ",
+        EventType.RAW: "",
+    }
+    
+    # Status message styling for render_status()
+    STATUS_COLORS = {
+        "info": Colors.CYAN,
+        "success": Colors.GREEN,
+        "warning": Colors.YELLOW,
+        "error": Colors.RED,
+    }
+    STATUS_ICONS = {
+        "info": "ℹ️ ",
+        "success": "✓ ",
+        "warning": "⚠ ",
+        "error": "✗ ",
+    }
+    
     def __init__(
         self,
         mode: DisplayMode = DisplayMode.RICH,
@@ -213,21 +241,8 @@ class RealtimeDisplay:
         if self.mode == DisplayMode.QUIET:
             return
         
-        colors = {
-            "info": Colors.CYAN,
-            "success": Colors.GREEN,
-            "warning": Colors.YELLOW,
-            "error": Colors.RED,
-        }
-        icons = {
-            "info": "ℹ️ ",
-            "success": "✓ ",
-            "warning": "⚠ ",
-            "error": "✗ ",
-        }
-        
-        color = colors.get(status_type, Colors.RESET)
-        icon = icons.get(status_type, "• ")
+        color = self.STATUS_COLORS.get(status_type, Colors.RESET)
+        icon = self.STATUS_ICONS.get(status_type, "• ")
         
         self._write(f"{color}{icon}{message}{Colors.RESET}")
     
@@ -354,20 +369,7 @@ class RealtimeDisplay:
     
     def _render_simple(self, event: OutputEvent) -> None:
         """Render event with minimal formatting."""
-        type_labels = {
-            EventType.TEXT: "",
-            EventType.THINKING: "[THINK] ",
-            EventType.TOOL_CALL: "[TOOL] ",
-            EventType.TOOL_RESULT: "[RESULT] ",
-            EventType.PROMPT: "[PROMPT] ",
-            EventType.CONFIRMATION: "[CONFIRM] ",
-            EventType.STARTED: "[START] ",
-            EventType.COMPLETED: "[DONE] ",
-            EventType.ERROR: "[ERROR] ",
-            EventType.RAW: "",
-        }
-        
-        label = type_labels.get(event.event_type, "")
+        label = self.SIMPLE_LABELS.get(event.event_type, "")
         self._write(f"{label}{event.content}")
     
     def _render_json(self, event: OutputEvent) -> None:
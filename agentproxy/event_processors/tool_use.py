@@ -24,7 +24,7 @@ import re
 from abc import ABC, abstractmethod
 from typing import Any, ClassVar, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 
 # --- Allowed label keys (bounded-cardinality for Prometheus) ---
@@ -113,6 +113,16 @@ class BashCommandMatcher(BaseModel):
     tag_prefix: str
     known_subcommands: frozenset[str] = frozenset()
 
+    _regex: re.Pattern = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        # Compiled once here; search() runs on every Bash tool_use event
+        self._regex = re.compile(self.pattern)
+
+    def search(self, command: str) -> Optional[re.Match]:
+        """Match this sub-tool in a bash command string."""
+        return self._regex.search(command)
+
 
 BASH_COMMAND_MATCHERS: list[BashCommandMatcher] = [
     BashCommandMatcher(
@@ -170,6 +180,10 @@ BASH_COMMAND_MATCHERS: list[BashCommandMatcher] = [
 ]
 
 
+# Trailing "*.ext" in a glob pattern (GlobToolProcessor)
+_GLOB_EXT_RE = re.compile(r'\*\.(\w+)$')
+
+
 # --- Processor base class and registry ---
 
 _PROCESSOR_REGISTRY: dict[str, "BaseToolUseEventProcessor"] = {}
@@ -239,7 +253,7 @@ class BashToolProcessor(BaseToolUseEventProcessor):
         tags = ["shell"]
 
         for matcher in BASH_COMMAND_MATCHERS:
-            match = re.search(matcher.pattern, inp.command)
+            match = matcher.search(inp.command)
             if match:
                 labels["command_category"] = matcher.category
                 labels["subcommand"] = match.group(1)
@@ -314,7 +328,7 @@ class GlobToolProcessor(BaseToolUseEventProcessor):
         tags = ["search", "glob"]
 
         if pattern:
-            ext_match = re.search(r'\*\.(\w+)$', pattern)
+            ext_match = _GLOB_EXT_RE.search(pattern)
             if ext_match:
                 labels["file_extension"] = ext_match.group(1).lower()
 
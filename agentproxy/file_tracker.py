@@ -6,7 +6,7 @@ Tracks files modified by Claude during execution.
 Parses Claude's streaming JSON output to detect file operations.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from .gemini_client import GeminiClient
 
@@ -46,6 +46,7 @@ class FileChangeTracker:
         self._changed_files: Dict[str, str] = {}  # path -> operation type
         self._is_done = False
         self._done_message = ""
+        self._gemini: Optional[GeminiClient] = None  # created on first use
     
     def process_event(self, event_data: Dict[str, Any]) -> None:
         """
@@ -107,8 +108,9 @@ class FileChangeTracker:
             return False
         
         try:
-            gemini = GeminiClient()
-            return gemini.analyze_completion(text)
+            if self._gemini is None:
+                self._gemini = GeminiClient()
+            return self._gemini.analyze_completion(text)
         except Exception:
             return False
     
@@ -159,19 +161,23 @@ class FileChangeTracker:
                 cwd=cwd, capture_output=True, timeout=5,
             )
 
-            # Diff against HEAD to get lines added/removed
+            # Diff against HEAD to get lines added/removed.
+            # Output is kept as bytes: only the numeric columns are read,
+            # so paths never need decoding.  -z NUL-terminates records so
+            # paths are emitted verbatim (no C-quoting of odd file names).
             result = subprocess.run(
-                ["git", "diff", "--numstat", "HEAD", "--"] + changed,
-                cwd=cwd, capture_output=True, text=True, timeout=5,
+                ["git", "diff", "--numstat", "-z", "HEAD", "--"] + changed,
+                cwd=cwd, capture_output=True, timeout=5,
             )
 
             lines_added = 0
             lines_removed = 0
 
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
-                parts = line.split("\t")
+            # Records are "added\tremoved\tpath\0"; renames put the old and
+            # new paths in separate NUL-terminated fields, which fail the
+            # digit check below and are skipped.
+            for record in result.stdout.split(b"\0"):
+                parts = record.split(b"\t", 2)
                 if len(parts) >= 2 and parts[0].isdigit() and parts[1].isdigit():
                     lines_added += int(parts[0])
                     lines_removed += int(parts[1])
@@ -79,6 +79,21 @@ class EventType(Enum):
     RAW = auto()            # Raw unparsed output
 
 
+# Display prefix per event type (see OutputEvent.__str__)
+_EVENT_PREFIXES: Dict[EventType, str] = {
+    EventType.TEXT: "📝",
+    EventType.THINKING: "💭",
+    EventType.TOOL_CALL: "🔧",
+    EventType.TOOL_RESULT: "✅",
+    EventType.PROMPT: "❓",
+    EventType.CONFIRMATION: "⚠️",
+    EventType.STARTED: "🚀",
+    EventType.COMPLETED: "✨",
+    EventType.ERROR: "❌",
+    EventType.RAW: "📄",
+}
+
+
 class ControllerState(Enum):
     """
     States of the Claude Code Controller.
@@ -127,19 +142,7 @@ class OutputEvent:
     
     def _get_prefix(self) -> str:
         """Get display prefix based on event type."""
-        prefixes = {
-            EventType.TEXT: "📝",
-            EventType.THINKING: "💭",
-            EventType.TOOL_CALL: "🔧",
-            EventType.TOOL_RESULT: "✅",
-            EventType.PROMPT: "❓",
-            EventType.CONFIRMATION: "⚠️",
-            EventType.STARTED: "🚀",
-            EventType.COMPLETED: "✨",
-            EventType.ERROR: "❌",
-            EventType.RAW: "📄",
-        }
-        return prefixes.get(self.event_type, "•")
+        return _EVENT_PREFIXES.get(self.event_type, "•")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
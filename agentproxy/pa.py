@@ -10,6 +10,7 @@ After each Claude iteration, PA thinks holistically and decides:
 """
 
 import json
+import re
 import socket
 import subprocess
 import time
@@ -17,6 +18,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional, Tuple
 
+from ._json import loads as _json_loads
 from .display import create_display
 from .file_tracker import FileChangeTracker
 from .function_executor import FunctionName, FunctionResult
@@ -27,6 +29,28 @@ from .pa_memory import PAMemory
 from .telemetry import get_telemetry
 
 
+# stream-json lines whose type no consumer reads ("user" lines echo tool
+# results, often whole file contents). Matched on the line prefix so they
+# can be dropped without decoding; other key orders fall through to json.
+_IGNORED_STREAM_LINE_RE = re.compile(r'^\{\s*"type"\s*:\s*"(?:user|system)"')
+
+# Phrases in a PASS verification result that mean nothing was actually run
+_VACUOUS_VERIFICATION_MARKERS = ("skipped", "no executable", "no scripts found")
+
+# Host name reported in Claude's OTEL resource attributes (see _hostname)
+_HOSTNAME: Optional[str] = None
+
+
+def _hostname() -> str:
+    """Return $HOSTNAME or the socket host name, resolved once per process."""
+    global _HOSTNAME
+    if _HOSTNAME is None:
+        import os
+        hostname = os.getenv("HOSTNAME")
+        _HOSTNAME = hostname if hostname is not None else socket.gethostname()
+    return _HOSTNAME
+
+
 def _jaccard_similarity(a: str, b: str) -> float:
     """Compute Jaccard similarity between two strings using word sets."""
     words_a = set(a.lower().split())
@@ -100,6 +124,10 @@ class PA:
         # Track the original task and last valid instruction for error recovery
         self._original_task: str = ""
         self._last_valid_instruction: str = ""
+
+        # Claude subprocess environment, built on first use (see
+        # _get_subprocess_env_with_trace_context)
+        self._claude_env: Optional[Dict[str, str]] = None
     
     @property
     def memory(self) -> PAMemory:
@@ -142,7 +170,13 @@ class PA:
 
         OTEL config (endpoints, protocols, exporters) is inherited from parent env.
         We only add session-specific resource attributes for linking PA ↔ Claude.
+
+        The environment is built on the first call and reused for every
+        later Claude iteration of this PA; Popen does not modify it.
         """
+        if self._claude_env is not None:
+            return self._claude_env
+
         import os
         telemetry = get_telemetry()
         env = os.environ.copy()
@@ -159,7 +193,7 @@ class PA:
         resource_attrs = [
             f"service.name=claude-code",
             f"service.namespace={namespace}",
-            f"host.name={os.getenv('HOSTNAME', socket.gethostname())}",
+            f"host.name={_hostname()}",
             f"agentproxy.owner={user_id}",
             f"agentproxy.project_id={project_id}",
             f"agentproxy.role=worker",
@@ -169,6 +203,7 @@ class PA:
 
         telemetry.log(f"Claude env: master_session_id={self.session_id[:8]}...")
 
+        self._claude_env = env
         return env
 
     def _ensure_git_repo(self) -> None:
@@ -207,18 +242,16 @@ class PA:
             if telemetry.enabled:
                 telemetry.log(f"Pre-work: git init failed ({e}), LOC tracking unavailable")
 
-    def _process_tool_enrichments(self, event_data: Dict[str, Any]) -> None:
+    def _process_tool_enrichments(self, event_data: Dict[str, Any], telemetry) -> None:
         """
         Run tool adapters on Claude's stream-json events for enriched telemetry.
 
         Extracts tool_use items from assistant messages and passes them through
         the appropriate adapter (Bash → git detection, Write → file metadata, etc.)
+        The caller passes its own ``telemetry`` handle so the per-event path
+        does not look it up again.
         """
-        if event_data.get("type") != "assistant":
-            return
-
-        telemetry = get_telemetry()
-        if not telemetry.enabled:
+        if not telemetry.enabled or event_data.get("type") != "assistant":
             return
 
         message = event_data.get("message", {})
@@ -242,10 +275,14 @@ class PA:
     def _should_use_multi_worker(self) -> bool:
         """Check whether multi-worker dispatch should be used.
 
-        All three conditions must be true:
+        All four conditions must be true:
         1. AGENTPROXY_MULTI_WORKER=1 env var is set
-        2. celery package is importable
-        3. redis package is importable
+        2. AGENTPROXY_CELERY_DISABLED=1 is not set
+        3. celery package is importable
+        4. redis package is importable
+
+        orjson is optional; when installed it only speeds up encoding of
+        task and result bodies.
         """
         import os
         if os.getenv("AGENTPROXY_MULTI_WORKER", "0") != "1":
@@ -259,10 +296,11 @@ class PA:
     def run_task(self, task: str, max_iterations: int = 100) -> Generator[OutputEvent, None, None]:
         """Execute a task with PA supervising Claude.
 
-        If multi-worker mode is enabled (``AGENTPROXY_MULTI_WORKER=1`` and
-        Celery+Redis are available), tasks are decomposed into milestones
-        and dispatched to Celery workers.  Otherwise the existing
-        single-worker path is used.
+        If multi-worker mode is enabled (``AGENTPROXY_MULTI_WORKER=1``,
+        ``AGENTPROXY_CELERY_DISABLED`` unset, and Celery+Redis available;
+        orjson is optional), tasks are decomposed into milestones and
+        dispatched to Celery workers.  Otherwise the existing single-worker
+        path is used.
         """
         if self._should_use_multi_worker():
             yield from self._run_task_multi_worker(task, max_iterations)
@@ -303,10 +341,10 @@ class PA:
             coord = Coordinator(self, queue=queue)
             yield from coord.run_task_multi_worker(task, max_iterations)
 
-            if self._state == ControllerState.PROCESSING:
+            if self._state is ControllerState.PROCESSING:
                 self._state = ControllerState.DONE
 
-            status = "completed" if self._state == ControllerState.DONE else "error"
+            status = "completed" if self._state is ControllerState.DONE else "error"
 
             if span:
                 duration = time.time() - task_start_time
@@ -390,7 +428,7 @@ class PA:
             iteration = 0
 
             for iteration in range(max_iterations):
-                if self.agent.is_done or self._state == ControllerState.DONE:
+                if self.agent.is_done or self._state is ControllerState.DONE:
                     break
 
                 if iteration > 0 and iteration % 3 == 0:
@@ -423,7 +461,7 @@ class PA:
                 yield self._emit("[PA] Verifying Claude's work...", EventType.TEXT, source="pa")
                 verification_result = None
                 for event in self._run_auto_verification(task, changed_files or []):
-                    if event.event_type == EventType.TOOL_RESULT and event.metadata.get("source") == "pa":
+                    if event.event_type is EventType.TOOL_RESULT and event.metadata.get("source") == "pa":
                         verification_result = event.content
                     yield event
 
@@ -439,13 +477,13 @@ class PA:
                     context_with_verification += f"\n\n[VERIFICATION RESULT]\n{verification_result}"
 
                 # Determine if verification truly passed (not vacuous)
-                verification_passed = (
-                    verification_result is not None
-                    and "PASS" in verification_result.upper()
-                    and "skipped" not in verification_result.lower()
-                    and "no executable" not in verification_result.lower()
-                    and "no scripts found" not in verification_result.lower()
-                )
+                verification_passed = False
+                if verification_result is not None:
+                    verification_lower = verification_result.lower()
+                    verification_passed = (
+                        "pass" in verification_lower
+                        and not any(m in verification_lower for m in _VACUOUS_VERIFICATION_MARKERS)
+                    )
 
                 # --- Record round delta ---
                 lines_added, lines_removed = self._file_tracker.get_code_changes()
@@ -505,8 +543,7 @@ class PA:
                         )
                         self._state = ControllerState.DONE
                         self.agent._is_done = True
-                        telemetry = get_telemetry()
-                        if telemetry.enabled and hasattr(telemetry, 'auto_completions'):
+                        if telemetry.enabled:
                             telemetry.auto_completions.add(1)
                         break
                     elif decision == "ERROR" and confidence >= 0.8:
@@ -581,13 +618,13 @@ class PA:
             summary = self.agent.generate_session_summary(task, self._claude_output_buffer, all_files)
             self.agent.save_session_summary(summary)
 
-            if self.agent.is_done or self._state == ControllerState.DONE:
+            if self.agent.is_done or self._state is ControllerState.DONE:
                 yield self._emit("Task completed", EventType.COMPLETED)
                 status = "completed"
                 # State already set to DONE when MARK_DONE was called
             elif self._state in (ControllerState.STOPPED, ControllerState.ERROR):
                 # Classifier gate already set a terminal state — preserve it
-                status = "stopped" if self._state == ControllerState.STOPPED else "error"
+                status = "stopped" if self._state is ControllerState.STOPPED else "error"
             else:
                 yield self._emit("Max iterations reached", EventType.ERROR)
                 status = "max_iterations"
@@ -675,22 +712,22 @@ class PA:
                 [self.claude_bin, "-p", instruction, "--output-format", "stream-json", "--verbose", "--dangerously-skip-permissions"],
                 stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, cwd=self.working_dir,
                 env=env,  # Pass OTEL env vars and session linking to Claude
-                bufsize=1  # Line-buffered for faster output
             )
-            # Use readline() for unbuffered, real-time output
-            while True:
-                line = process.stdout.readline()
-                if not line and process.poll() is not None:
-                    break
+            # Tool enrichment only feeds telemetry; skip the call when it is off
+            enrich = telemetry.enabled
+
+            # Iterating the pipe reads whatever is available in one call and
+            # splits it into lines, so events still arrive as Claude emits them
+            for line in process.stdout:
                 line = line.rstrip()
-                if not line:
+                if not line or _IGNORED_STREAM_LINE_RE.match(line):
                     continue
                 try:
-                    data = json.loads(line)
+                    data = _json_loads(line)
                     self._file_tracker.process_event(data)
-                    self._process_tool_enrichments(data)
-                    for event in self._parse_claude_event(data):
-                        yield event
+                    if enrich:
+                        self._process_tool_enrichments(data, telemetry)
+                    yield from self._parse_claude_event(data)
                 except json.JSONDecodeError:
                     yield self._emit(line, EventType.RAW, source="claude")
             process.wait(timeout=300)
@@ -13,6 +13,7 @@ from dataclasses import dataclass, field
 from typing import Optional, Callable, List, Dict, Any, Generator
 from queue import Queue, Empty
 
+from ._json import loads as _json_loads
 from .models import ControllerState
 
 
@@ -116,7 +117,7 @@ class ClaudeProcessManager:
                     continue
                 
                 try:
-                    event = json.loads(line)
+                    event = _json_loads(line)
                     if self.on_output:
                         self.on_output(event)
                     yield event
@@ -18,7 +18,6 @@ Usage:
 
 import argparse
 import asyncio
-import json
 import os
 from typing import Optional, AsyncGenerator
 from threading import Thread
@@ -29,6 +28,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from ._json import dumps as _json_dumps
 from .pa import PA, create_pa, list_sessions, OutputEvent, EventType
 from .telemetry import get_telemetry
 
@@ -102,6 +102,10 @@ active_sessions: dict[str, PA] = {}
 # SSE Streaming
 # =============================================================================
 
+# Marks the end of a task's event stream on the thread -> SSE queue
+_DONE = object()
+
+
 def event_to_sse(event: OutputEvent) -> str:
     """Convert OutputEvent to SSE format."""
     data = {
@@ -109,7 +113,23 @@ def event_to_sse(event: OutputEvent) -> str:
         "content": event.content,
         "metadata": event.metadata or {},
     }
-    return f"data: {json.dumps(data)}\n\n"
+    return f"data: {_json_dumps(data)}\n\n"
+
+
+def _next_batch(event_queue: Queue) -> list:
+    """
+    Block briefly for one event, then take whatever else is already queued.
+    
+    Bursts of events cost one executor hop and one SSE write instead of
+    one each. The batch stops at ``_DONE`` so it is always the last item.
+    """
+    batch = [event_queue.get(timeout=0.1)]
+    while batch[-1] is not _DONE:
+        try:
+            batch.append(event_queue.get_nowait())
+        except Empty:
+            break
+    return batch
 
 
 async def stream_task(
@@ -132,8 +152,7 @@ async def stream_task(
         """Run PA in background thread."""
         try:
             # Create working directory if needed
-            if not os.path.exists(working_dir):
-                os.makedirs(working_dir)
+            os.makedirs(working_dir, exist_ok=True)
             
             # Create PA instance
             pa = create_pa(
@@ -169,7 +188,7 @@ async def stream_task(
                 event_queue.put(event)
             
             # Signal completion
-            event_queue.put(None)
+            event_queue.put(_DONE)
             
             # Cleanup
             if pa.session_id in active_sessions:
@@ -181,7 +200,7 @@ async def stream_task(
                 content=f"Server error: {str(e)}",
                 metadata={"error": str(e)},
             ))
-            event_queue.put(None)
+            event_queue.put(_DONE)
     
     # Start PA in background thread
     thread = Thread(target=run_pa, daemon=True)
@@ -191,22 +210,24 @@ async def stream_task(
     while True:
         try:
             # Check for events with timeout to allow async cancellation
-            event = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: event_queue.get(timeout=0.1)
+            batch = await asyncio.get_event_loop().run_in_executor(
+                None, _next_batch, event_queue
             )
-            
-            if event is None:
-                # Stream complete
-                break
-            
-            yield event_to_sse(event)
-            
         except Empty:
             # No event yet, continue waiting
             continue
         except asyncio.CancelledError:
             # Client disconnected
             break
+        
+        done = batch[-1] is _DONE
+        if done:
+            batch.pop()
+        if batch:
+            yield "".join(map(event_to_sse, batch))
+        if done:
+            # Stream complete
+            break
     
     # Send final SSE event
     yield "data: {\"type\": \"done\"}\n\n"
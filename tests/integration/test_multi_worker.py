@@ -62,6 +62,84 @@ class TestCeleryAppFactory:
         assert app.conf.task_acks_late is True
         assert app.conf.task_reject_on_worker_lost is True
         assert app.conf.result_expires == 3600
+        assert app.conf.task_ignore_result is True
+        assert app.conf.worker_pool == "prefork"
+        assert app.conf.broker_pool_limit == 10
+        assert app.conf.broker_connection_retry_on_startup is True
+
+    def test_result_backend_connection_options(self):
+        """Keepalive, health checks and timeout retries reach the backend's Redis pool."""
+        from agentproxy.coordinator.celery_app import make_celery_app
+
+        connparams = make_celery_app().backend.connparams
+        assert connparams["socket_keepalive"] is True
+        assert connparams["health_check_interval"] == 30
+        assert connparams["retry_on_timeout"] is True
+
+    def test_make_celery_app_pool_env(self):
+        from agentproxy.coordinator.celery_app import make_celery_app, reset_celery_app
+
+        reset_celery_app()
+        try:
+            with patch.dict(os.environ, {
+                "AGENTPROXY_CELERY_POOL": "gevent",
+                "AGENTPROXY_BROKER_POOL_LIMIT": "not-a-number",
+            }):
+                app = make_celery_app()
+            assert app.conf.worker_pool == "gevent"
+            assert app.conf.broker_pool_limit == 10
+        finally:
+            reset_celery_app()
+
+    def test_task_compression_default(self):
+        """gzip regardless of what this process has installed."""
+        from agentproxy.coordinator.celery_app import make_celery_app
+
+        app = make_celery_app()
+        assert app.conf.task_compression == "gzip"
+        assert app.conf.result_compression == "gzip"
+
+    def test_task_compression_zstd_opt_in(self):
+        from agentproxy.coordinator.celery_app import _task_compression
+
+        with patch.dict(os.environ, {"AGENTPROXY_TASK_COMPRESSION": "zstd"}):
+            assert _task_compression() == "zstd"
+
+    def test_task_compression_env_override(self):
+        from agentproxy.coordinator.celery_app import make_celery_app, reset_celery_app
+
+        reset_celery_app()
+        try:
+            with patch.dict(os.environ, {"AGENTPROXY_TASK_COMPRESSION": "none"}):
+                app = make_celery_app()
+            assert app.conf.task_compression is None
+            assert app.conf.result_compression is None
+        finally:
+            reset_celery_app()
+
+    def test_run_milestone_keeps_result(self):
+        """run_milestone opts back into the result backend."""
+        from agentproxy.coordinator.tasks import run_milestone
+
+        assert run_milestone.ignore_result is False
+
+    def test_make_celery_app_is_shared(self):
+        from agentproxy.coordinator.celery_app import make_celery_app, reset_celery_app
+
+        app = make_celery_app()
+        assert make_celery_app() is app
+
+        reset_celery_app()
+        try:
+            assert make_celery_app() is not app
+        finally:
+            reset_celery_app()
+
+    def test_custom_urls_build_unshared_app(self):
+        from agentproxy.coordinator.celery_app import make_celery_app
+
+        custom = make_celery_app(broker_url="redis://custom-host:6380/0")
+        assert custom is not make_celery_app()
 
     def test_make_celery_app_custom_urls(self):
         from agentproxy.coordinator.celery_app import make_celery_app
@@ -73,11 +151,56 @@ class TestCeleryAppFactory:
         assert "custom-host" in str(app.conf.broker_url)
 
     def test_task_serializer_is_json(self):
-        from agentproxy.coordinator.celery_app import make_celery_app
+        from agentproxy.coordinator.celery_app import ORJSON_SERIALIZER, make_celery_app
+
+        try:
+            import orjson  # noqa: F401
+            expected = ORJSON_SERIALIZER
+        except ImportError:
+            expected = "json"
 
         app = make_celery_app()
-        assert app.conf.task_serializer == "json"
-        assert app.conf.result_serializer == "json"
+        assert app.conf.task_serializer == expected
+        assert app.conf.result_serializer == expected
+        assert app.conf.accept_content == ["json"]
+
+    def test_json_fallback_without_orjson(self):
+        """Without orjson the app builds on plain json and its backend loads."""
+        from agentproxy.coordinator.celery_app import _register_orjson, make_celery_app
+
+        with patch("agentproxy._json.orjson", None):
+            assert _register_orjson() is False
+            app = make_celery_app(broker_url="redis://localhost:6379/0")
+            assert app.conf.task_serializer == "json"
+            assert app.conf.result_serializer == "json"
+            assert app.backend is not None
+
+    def test_orjson_serializer_roundtrip(self):
+        pytest.importorskip("orjson")
+        from kombu.serialization import dumps, loads
+
+        from agentproxy.coordinator.celery_app import ORJSON_SERIALIZER, _register_orjson
+
+        assert _register_orjson() is True
+        payload = {"status": "completed", "events": [{"content": "héllo"}], "duration": 1.5}
+        content_type, encoding, body = dumps(payload, serializer=ORJSON_SERIALIZER)
+        # Plain JSON: json-only peers accept and decode it
+        assert content_type == "application/json"
+        assert loads(body, content_type, encoding, accept=["application/json"]) == payload
+
+    def test_orjson_serializer_matches_json_on_non_str_keys(self):
+        pytest.importorskip("orjson")
+        from kombu.serialization import dumps, loads
+
+        from agentproxy.coordinator.celery_app import ORJSON_SERIALIZER, _register_orjson
+
+        assert _register_orjson() is True
+        payload = {"metadata": {1: "int key"}}
+        decoded = []
+        for name in (ORJSON_SERIALIZER, "json"):
+            content_type, encoding, body = dumps(payload, serializer=name)
+            decoded.append(loads(body, content_type, encoding, accept=["application/json"]))
+        assert decoded[0] == decoded[1] == {"metadata": {"1": "int key"}}
 
 
 @requires_celery
@@ -90,6 +90,13 @@ class TestOutputEventSerialization:
         assert restored.content == "hello world"
         assert restored.metadata == {"source": "test"}
 
+    def test_serialize_matches_to_dict(self):
+        from agentproxy.models import OutputEvent, EventType
+        from agentproxy.coordinator.models import serialize_output_event
+
+        event = OutputEvent(event_type=EventType.ERROR, content="x", metadata={"k": 1})
+        assert serialize_output_event(event) == event.to_dict()
+
     def test_deserialize_all_event_types(self):
         from agentproxy.models import EventType
         from agentproxy.coordinator.models import deserialize_output_event
@@ -151,6 +158,70 @@ class TestCeleryAvailability:
         from agentproxy.coordinator import is_celery_available
         assert is_celery_available() is True
 
+    def test_orjson_is_not_required(self):
+        """orjson only speeds up encoding; multi-worker works without it."""
+        import sys
+
+        try:
+            import celery  # noqa: F401
+            import redis  # noqa: F401
+        except ImportError:
+            pytest.skip("celery and/or redis not installed")
+
+        from agentproxy.coordinator import is_celery_available
+
+        with patch.dict(sys.modules, {"orjson": None}):
+            assert is_celery_available() is True
+
+
+class TestCeleryDisabled:
+    """Test the AGENTPROXY_CELERY_DISABLED=1 switch."""
+
+    def test_make_celery_app_returns_stub(self):
+        from agentproxy.coordinator.celery_app import _NullApp, make_celery_app
+
+        with patch.dict(os.environ, {"AGENTPROXY_CELERY_DISABLED": "1"}):
+            app = make_celery_app()
+        assert isinstance(app, _NullApp)
+
+    def test_stub_tasks_raise_on_submission(self):
+        from agentproxy.coordinator.celery_app import _NullApp
+
+        app = _NullApp()
+
+        @app.task(bind=True, name="agentproxy.example")
+        def example(self):
+            return 1
+
+        with pytest.raises(RuntimeError, match="AGENTPROXY_CELERY_DISABLED"):
+            example.apply_async(args=[])
+        with pytest.raises(RuntimeError, match="AGENTPROXY_CELERY_DISABLED"):
+            app.conf
+
+    def test_stub_supports_attribute_introspection(self):
+        from agentproxy.coordinator.celery_app import CeleryDisabledError, _NullApp
+
+        app = _NullApp()
+        assert hasattr(app, "conf") is False
+        assert getattr(app, "send_task", None) is None
+        with pytest.raises(CeleryDisabledError, match="AGENTPROXY_CELERY_DISABLED"):
+            app.send_task
+
+    def test_is_celery_available_false_when_disabled(self):
+        from agentproxy.coordinator import is_celery_available
+
+        with patch.dict(os.environ, {"AGENTPROXY_CELERY_DISABLED": "1"}):
+            assert is_celery_available() is False
+
+    def test_worker_cli_exits_when_disabled(self, capsys):
+        from agentproxy.coordinator.worker_cli import main
+
+        with patch.dict(os.environ, {"AGENTPROXY_CELERY_DISABLED": "1"}):
+            with pytest.raises(SystemExit) as exc_info:
+                main([])
+        assert exc_info.value.code == 1
+        assert "AGENTPROXY_CELERY_DISABLED" in capsys.readouterr().err
+
 
 # ---------------------------------------------------------------------------
 # Milestone parsing
@@ -257,6 +328,175 @@ class TestContextAccumulation:
         assert "Step 2" in new_ctx["prior_summary"]
 
 
+# ---------------------------------------------------------------------------
+# Progress streaming
+# ---------------------------------------------------------------------------
+
+
+def _progress_message(start, *contents):
+    """Build an on_message payload as the result backend delivers it."""
+    from agentproxy.models import EventType, OutputEvent
+    from agentproxy.coordinator.models import PROGRESS_STATE
+
+    return {
+        "status": PROGRESS_STATE,
+        "result": {
+            "start": start,
+            "events": [
+                OutputEvent(event_type=EventType.TEXT, content=c).to_dict()
+                for c in contents
+            ]
+        },
+    }
+
+
+class TestProgressStreaming:
+    """Test Coordinator relaying PROGRESS updates from run_milestone."""
+
+    def _async_result(self, messages, final):
+        result = MagicMock()
+
+        def fake_get(timeout=None, on_message=None, **kwargs):
+            if on_message is not None:
+                for message in messages:
+                    on_message(message)
+            return final
+
+        result.get.side_effect = fake_get
+        return result
+
+    def _drain(self, async_result):
+        """Run _poll_result to completion; return (contents, streamed)."""
+        from agentproxy.coordinator.coordinator import Coordinator
+
+        gen = Coordinator(MagicMock())._poll_result(async_result, 0, 1)
+        contents = []
+        with pytest.raises(StopIteration) as stop:
+            while True:
+                contents.append(next(gen).content)
+        return contents, stop.value.value
+
+    def test_poll_result_yields_progress_events(self):
+        async_result = self._async_result(
+            [
+                {"status": "STARTED", "result": None},
+                _progress_message(0, "one"),
+                _progress_message(1, "two", "three"),
+            ],
+            final={},
+        )
+
+        assert self._drain(async_result) == (["one", "two", "three"], 3)
+
+    def test_repeated_update_is_not_yielded_twice(self):
+        """A reconnect re-sends the last stored state."""
+        async_result = self._async_result(
+            [
+                _progress_message(0, "one", "two"),
+                _progress_message(0, "one", "two"),
+                _progress_message(2, "three"),
+            ],
+            final={},
+        )
+
+        assert self._drain(async_result) == (["one", "two", "three"], 3)
+
+    def test_streaming_stops_at_gap(self):
+        """Events after a lost update are left for the final replay."""
+        async_result = self._async_result(
+            [
+                _progress_message(0, "one"),
+                _progress_message(2, "three"),
+                _progress_message(3, "four"),
+            ],
+            final={},
+        )
+
+        assert self._drain(async_result) == (["one"], 1)
+
+    def test_falls_back_to_polling_without_on_message(self):
+        from agentproxy.coordinator import coordinator as coordinator_mod
+        from agentproxy.models import EventType
+
+        async_result = MagicMock()
+        async_result.get.side_effect = RuntimeError(
+            "Backend does not support on_message callback"
+        )
+        async_result.ready.side_effect = [False, True]
+
+        with patch.object(coordinator_mod, "_POLL_INTERVAL", 0):
+            gen = coordinator_mod.Coordinator(MagicMock())._poll_result(async_result, 0, 1)
+            events = list(gen)
+
+        assert [e.event_type for e in events] == [EventType.THINKING]
+        assert async_result.ready.call_count == 2
+
+    def test_run_task_replays_only_unstreamed_events(self):
+        from agentproxy.models import EventType, OutputEvent
+        from agentproxy.coordinator.coordinator import Coordinator
+        from agentproxy.coordinator.models import MilestoneResult
+
+        mock_pa = MagicMock()
+        mock_pa.working_dir = "/tmp/test"
+        mock_pa.session_id = "s"
+        mock_pa.agent.generate_task_breakdown.return_value = "- [ ] Only step"
+
+        final = MilestoneResult(
+            status="completed",
+            events=[
+                OutputEvent(event_type=EventType.TEXT, content=c).to_dict()
+                for c in ("one", "two", "late")
+            ],
+        ).to_dict()
+        async_result = self._async_result([_progress_message(0, "one", "two")], final)
+
+        with patch("agentproxy.coordinator.tasks.run_milestone") as mock_task:
+            mock_task.apply_async.return_value = async_result
+            events = list(Coordinator(mock_pa).run_task_multi_worker("task"))
+
+        worker_contents = [e.content for e in events if e.content in ("one", "two", "late")]
+        assert worker_contents == ["one", "two", "late"]
+
+    def _run_milestone(self, contents, interval):
+        pytest.importorskip("celery")
+        from agentproxy.models import EventType, OutputEvent
+        from agentproxy.coordinator import tasks
+
+        mock_pa = MagicMock()
+        mock_pa.run_task.return_value = iter(
+            [OutputEvent(event_type=EventType.TEXT, content=c) for c in contents]
+        )
+        mock_pa._session_files_changed = []
+
+        with patch("agentproxy.pa.PA", return_value=mock_pa), \
+                patch.object(tasks, "_PROGRESS_INTERVAL", interval), \
+                patch.object(tasks.run_milestone, "update_state") as update_state:
+            result = tasks.run_milestone.apply(
+                args=["step", "/tmp", "s", 0, {}]
+            ).get()
+        return result, update_state
+
+    def test_run_milestone_publishes_only_new_events(self):
+        from agentproxy.coordinator.models import PROGRESS_STATE
+
+        result, update_state = self._run_milestone(["a", "b", "c"], interval=0)
+
+        assert result["status"] == "completed"
+        assert update_state.call_count == 3
+        assert all(c.kwargs["state"] == PROGRESS_STATE for c in update_state.call_args_list)
+        published = [
+            (c.kwargs["meta"]["start"], [e["content"] for e in c.kwargs["meta"]["events"]])
+            for c in update_state.call_args_list
+        ]
+        assert published == [(0, ["a"]), (1, ["b"]), (2, ["c"])]
+
+    def test_run_milestone_throttles_progress(self):
+        result, update_state = self._run_milestone(["a", "b", "c"], interval=3600)
+
+        update_state.assert_not_called()
+        assert [e["content"] for e in result["events"]] == ["a", "b", "c"]
+
+
 # ---------------------------------------------------------------------------
 # _should_use_multi_worker
 # ---------------------------------------------------------------------------
@@ -362,6 +602,29 @@ class TestWorkerCLI:
         assert args.concurrency == 2
 
 
+    def test_missing_celery_exits_with_install_hint(self, capsys):
+        """A missing celery install is reported, not raised."""
+        from agentproxy.coordinator.worker_cli import main
+
+        with patch(
+            "agentproxy.coordinator.celery_app.make_celery_app",
+            side_effect=ImportError("No module named 'celery'"),
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                main([])
+        assert exc_info.value.code == 1
+        assert "pip install 'agentproxy[worker]'" in capsys.readouterr().err
+
+    def test_invalid_loglevel_rejected_before_celery(self, capsys):
+        from agentproxy.coordinator.worker_cli import main
+
+        with patch("agentproxy.coordinator.celery_app.make_celery_app") as make_app:
+            with pytest.raises(SystemExit) as exc_info:
+                main(["--loglevel", "verbose"])
+        assert exc_info.value.code == 2
+        make_app.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # Telemetry metrics existence
 # ---------------------------------------------------------------------------
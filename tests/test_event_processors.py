@@ -10,6 +10,8 @@ Test categories:
   6. Integration — process_tool_event end-to-end
 """
 
+from unittest.mock import patch
+
 import pytest
 from pydantic import ValidationError
 
@@ -243,6 +245,18 @@ class TestBashCommandMatcher:
         result = process_tool_event("Bash", {"command": "/usr/bin/python3 script.py"})
         assert result.labels["command_category"] == "python3"
 
+    def test_matcher_pattern_compiled_once(self):
+        matcher = BashCommandMatcher(
+            command_name="kubectl",
+            pattern=r'\bkubectl\s+([a-z][-a-z]*)',
+            category="kubectl",
+            tag_prefix="kubectl",
+        )
+        with patch("agentproxy.event_processors.tool_use.re.compile") as compile_:
+            assert matcher.search("kubectl apply -f x").group(1) == "apply"
+            assert matcher.search("ls") is None
+        compile_.assert_not_called()
+
     def test_custom_matcher_extensibility(self):
         """Third-party code can append a new matcher."""
         custom = BashCommandMatcher(
@@ -0,0 +1,155 @@
+"""
+Unit tests for the PA web server helpers.
+
+Exercises the module-level helpers in ``agentproxy.server`` without
+starting uvicorn or spawning Claude.
+"""
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+
+# ---------------------------------------------------------------------------
+# SSE streaming
+# ---------------------------------------------------------------------------
+
+
+class TestEventToSse:
+    """Test server.event_to_sse()."""
+
+    def test_round_trips_event(self):
+        import json
+
+        from agentproxy import server
+        from agentproxy.models import EventType, OutputEvent
+
+        event = OutputEvent(
+            event_type=EventType.TOOL_CALL,
+            content="Write(café.py)",
+            metadata={"tool": "Write", 1: "int key"},
+        )
+        chunk = server.event_to_sse(event)
+
+        assert chunk.startswith("data: ") and chunk.endswith("\n\n")
+        assert json.loads(chunk[len("data: "):]) == {
+            "type": EventType.TOOL_CALL.value,
+            "content": "Write(café.py)",
+            "metadata": {"tool": "Write", "1": "int key"},
+        }
+
+
+def _collect_stream(**kwargs):
+    """Drain server.stream_task() into a list of SSE strings."""
+    import asyncio
+
+    from agentproxy import server
+
+    async def _drain():
+        return [chunk async for chunk in server.stream_task(**kwargs)]
+
+    return asyncio.run(_drain())
+
+
+class TestStreamTask:
+    """Test server.stream_task() with a stubbed PA."""
+
+    def _fake_pa(self, events):
+        from unittest.mock import MagicMock
+
+        pa = MagicMock()
+        pa.session_id = "abc123"
+        pa.run_task.return_value = iter(events)
+        return pa
+
+    def test_streams_events_then_done(self, tmp_path):
+        from unittest.mock import patch
+
+        from agentproxy import server
+        from agentproxy.models import EventType, OutputEvent
+
+        pa = self._fake_pa([OutputEvent(event_type=EventType.TEXT, content="hello")])
+        with patch.object(server, "create_pa", return_value=pa):
+            chunks = _collect_stream(
+                task="t",
+                working_dir=str(tmp_path),
+                session_id=None,
+                mission=None,
+                max_iterations=1,
+            )
+
+        assert "Session: abc123" in chunks[0]
+        assert any('"content":"hello"' in c for c in chunks)
+        assert chunks[-1] == 'data: {"type": "done"}\n\n'
+
+    def test_creates_missing_working_dir(self, tmp_path):
+        from unittest.mock import patch
+
+        from agentproxy import server
+
+        target = tmp_path / "a" / "b"
+        for _ in range(2):
+            # A directory removed between requests is created again
+            assert not target.exists()
+            with patch.object(server, "create_pa", return_value=self._fake_pa([])):
+                _collect_stream(
+                    task="t",
+                    working_dir=str(target),
+                    session_id=None,
+                    mission=None,
+                    max_iterations=1,
+                )
+            assert target.is_dir()
+            target.rmdir()
+
+    def test_error_terminates_stream(self, tmp_path):
+        from unittest.mock import patch
+
+        from agentproxy import server
+
+        with patch.object(server, "create_pa", side_effect=RuntimeError("boom")):
+            chunks = _collect_stream(
+                task="t",
+                working_dir=str(tmp_path),
+                session_id=None,
+                mission=None,
+                max_iterations=1,
+            )
+
+        assert "Server error: boom" in chunks[0]
+        assert chunks[-1] == 'data: {"type": "done"}\n\n'
+
+
+class TestNextBatch:
+    """Test server._next_batch()."""
+
+    def test_takes_everything_already_queued(self):
+        from queue import Queue
+
+        from agentproxy import server
+
+        q = Queue()
+        for i in range(3):
+            q.put(i)
+        assert server._next_batch(q) == [0, 1, 2]
+        assert q.empty()
+
+    def test_stops_at_done(self):
+        from queue import Queue
+
+        from agentproxy import server
+
+        q = Queue()
+        q.put("a")
+        q.put(server._DONE)
+        q.put("late")
+        assert server._next_batch(q) == ["a", server._DONE]
+        assert q.get_nowait() == "late"
+
+    def test_empty_queue_raises(self):
+        from queue import Empty, Queue
+
+        from agentproxy import server
+
+        with pytest.raises(Empty):
+            server._next_batch(Queue())
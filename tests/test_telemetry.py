@@ -322,6 +322,58 @@ class TestSessionAwareTelemetry:
             assert "agentproxy.role=worker" in resource_attrs
             assert f"agentproxy.master_session_id={pa.session_id}" in resource_attrs
 
+    def test_claude_subprocess_hostname_resolved_once(self):
+        """The host name attribute is looked up once and then reused."""
+        import agentproxy.pa as pa_module
+        from agentproxy import PA
+
+        pa = PA(working_dir=".", session_id="test-session-123")
+        with patch.object(pa_module, "_HOSTNAME", None), \
+                patch.dict(os.environ, {"HOSTNAME": "box-1"}), \
+                patch("agentproxy.pa.socket.gethostname") as gethostname:
+            first = pa._get_subprocess_env_with_trace_context()
+            os.environ["HOSTNAME"] = "box-2"
+            second = pa._get_subprocess_env_with_trace_context()
+
+        gethostname.assert_not_called()
+        assert "host.name=box-1" in first["OTEL_RESOURCE_ATTRIBUTES"]
+        assert "host.name=box-1" in second["OTEL_RESOURCE_ATTRIBUTES"]
+
+    def test_claude_subprocess_env_built_once_per_pa(self):
+        """The subprocess env is copied once and reused across iterations."""
+        from agentproxy import PA
+
+        pa = PA(working_dir=".", session_id="test-session-123")
+        first = pa._get_subprocess_env_with_trace_context()
+        with patch("agentproxy.pa.get_telemetry") as mock_get:
+            second = pa._get_subprocess_env_with_trace_context()
+            mock_get.assert_not_called()
+        assert second is first
+
+    def test_tool_enrichments_use_caller_telemetry(self):
+        """Tool enrichment records on the telemetry handle passed by the caller."""
+        from agentproxy import PA
+
+        pa = PA(working_dir=".", session_id="test-session-123")
+        telemetry = MagicMock()
+        telemetry.enabled = True
+        event = {
+            "type": "assistant",
+            "message": {"content": [
+                {"type": "tool_use", "name": "Bash", "input": {"command": "git commit -m x"}},
+            ]},
+        }
+
+        with patch("agentproxy.pa.get_telemetry") as mock_get:
+            pa._process_tool_enrichments(event, telemetry)
+            mock_get.assert_not_called()
+        telemetry.tool_executions.add.assert_called_once()
+
+        telemetry.reset_mock()
+        telemetry.enabled = False
+        pa._process_tool_enrichments(event, telemetry)
+        telemetry.tool_executions.add.assert_not_called()
+
     def test_service_namespace_defaults_to_user_project(self):
         """Service namespace should default to {user}.{project} for multi-tenant aggregation."""
         test_env = {
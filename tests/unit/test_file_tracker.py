@@ -0,0 +1,93 @@
+"""
+Unit tests for FileChangeTracker.
+
+get_code_changes() uses a throwaway git repository so the real
+``git diff --numstat`` output is parsed.
+"""
+
+import shutil
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from agentproxy.file_tracker import FileChangeTracker
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=cwd, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init")
+    (tmp_path / "existing.py").write_text("a\nb\nc\n")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-m", "baseline")
+    return tmp_path
+
+
+@requires_git
+class TestGetCodeChanges:
+    """Test line counting via git diff --numstat."""
+
+    def test_no_changed_files_returns_zero(self, repo):
+        tracker = FileChangeTracker(str(repo))
+        assert tracker.get_code_changes() == (0, 0)
+
+    def test_counts_modified_and_new_files(self, repo):
+        (repo / "existing.py").write_text("a\nB\nc\nd\n")
+        (repo / "new.py").write_text("x\ny\n")
+
+        tracker = FileChangeTracker(str(repo))
+        tracker._changed_files = {"existing.py": "Edit", "new.py": "Write"}
+
+        # existing.py: +2 -1, new.py: +2
+        assert tracker.get_code_changes() == (4, 1)
+
+    def test_handles_unusual_file_names(self, repo):
+        name = "dir with space/ünïcode\tname.txt"
+        (repo / "dir with space").mkdir()
+        (repo / name).write_text("1\n2\n3\n")
+
+        tracker = FileChangeTracker(str(repo))
+        tracker._changed_files = {name: "Write"}
+
+        assert tracker.get_code_changes() == (3, 0)
+
+    def test_binary_files_are_skipped(self, repo):
+        (repo / "blob.bin").write_bytes(b"\x00\x01\x02")
+
+        tracker = FileChangeTracker(str(repo))
+        tracker._changed_files = {"blob.bin": "Write"}
+
+        assert tracker.get_code_changes() == (0, 0)
+
+    def test_not_a_repo_returns_zero(self, tmp_path):
+        (tmp_path / "f.py").write_text("x\n")
+        tracker = FileChangeTracker(str(tmp_path))
+        tracker._changed_files = {"f.py": "Write"}
+        assert tracker.get_code_changes() == (0, 0)
+
+
+class TestCheckCompletion:
+    """Test the Gemini-backed completion check."""
+
+    def test_gemini_client_is_reused(self):
+        tracker = FileChangeTracker(".")
+        with patch("agentproxy.file_tracker.GeminiClient") as MockClient:
+            MockClient.return_value.analyze_completion.return_value = True
+            assert tracker._check_completion("All tasks are complete now.") is True
+            assert tracker._check_completion("Everything is finished here.") is True
+        assert MockClient.call_count == 1
+
+    def test_missing_api_key_is_not_cached(self):
+        tracker = FileChangeTracker(".")
+        with patch("agentproxy.file_tracker.GeminiClient", side_effect=ValueError("no key")):
+            assert tracker._check_completion("All tasks are complete now.") is False
+        assert tracker._gemini is None
@@ -0,0 +1,38 @@
+"""
+Unit tests for the optional-orjson JSON helpers.
+"""
+
+import importlib
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from agentproxy import _json
+
+PAYLOAD = {"type": 3, "content": "Write(café.py)", "metadata": {"tool": "Write", 1: None}}
+
+
+def _without_orjson():
+    """Return (loads, dumps) as the module defines them when orjson is missing."""
+    try:
+        with patch.dict(sys.modules, {"orjson": None}):
+            module = importlib.reload(_json)
+            return module.loads, module.dumps
+    finally:
+        importlib.reload(_json)
+
+
+def test_fallback_uses_stdlib():
+    loads, dumps = _without_orjson()
+    assert loads is json.loads
+    assert json.loads(dumps(PAYLOAD)) == json.loads(json.dumps(PAYLOAD))
+
+
+def test_both_paths_encode_the_same_text():
+    pytest.importorskip("orjson")
+    _, stdlib_dumps = _without_orjson()
+
+    assert _json.orjson is not None
+    assert _json.dumps(PAYLOAD) == stdlib_dumps(PAYLOAD)
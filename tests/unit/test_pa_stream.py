@@ -0,0 +1,139 @@
+"""
+Unit tests for PA._stream_claude().
+
+Runs a stand-in ``claude`` executable that prints canned stream-json
+lines, so the real subprocess and parsing path is exercised without the
+Claude CLI.
+"""
+
+import json
+import sys
+import textwrap
+from unittest.mock import patch
+
+import pytest
+
+from agentproxy.models import EventType
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses a shebang script")
+
+
+def _fake_claude(tmp_path, lines, wait_for=None):
+    """Write an executable that prints *lines* to stdout and exits.
+
+    With *wait_for*, the script blocks after the first line until that
+    path exists and touches ``<wait_for>.exited`` just before exiting, so a
+    test can prove the line was read while the script was still running.
+    """
+    script = tmp_path / "fake-claude"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        + textwrap.dedent(
+            f"""
+            import os, sys, time
+            for i, line in enumerate({lines!r}):
+                sys.stdout.write(line + "\\n")
+                sys.stdout.flush()
+                if i == 0 and {wait_for!r}:
+                    deadline = time.time() + 10
+                    while not os.path.exists({wait_for!r}) and time.time() < deadline:
+                        time.sleep(0.01)
+            if {wait_for!r}:
+                open({wait_for!r} + ".exited", "w").close()
+            """
+        )
+    )
+    script.chmod(0o755)
+    return str(script)
+
+
+@pytest.fixture
+def make_pa(tmp_path):
+    from agentproxy import PA
+
+    def _make(lines, wait_for=None):
+        return PA(
+            working_dir=str(tmp_path),
+            session_id="stream-test",
+            display_mode="quiet",
+            context_dir=str(tmp_path / ".ctx"),
+            claude_bin=_fake_claude(tmp_path, lines, wait_for),
+        )
+
+    return _make
+
+
+class TestStreamClaude:
+    """Test parsing of Claude's stream-json output."""
+
+    def test_parses_events_in_order(self, make_pa):
+        pa = make_pa([
+            json.dumps({"type": "assistant", "message": {"content": [
+                {"type": "text", "text": "working"},
+                {"type": "tool_use", "name": "Write", "input": {"file_path": "/x/app.py"}},
+            ]}}),
+            "",
+            "not json",
+            json.dumps({"type": "result"}),
+        ])
+
+        events = list(pa._stream_claude("do it"))
+
+        assert [(e.event_type, e.content) for e in events] == [
+            (EventType.TEXT, "working"),
+            (EventType.TOOL_CALL, "Write(app.py)"),
+            (EventType.RAW, "not json"),
+            (EventType.COMPLETED, "Claude finished"),
+        ]
+        assert "/x/app.py" in pa._file_tracker.get_changed_files()
+
+    def test_user_and_system_lines_are_not_decoded(self, make_pa):
+        import agentproxy.pa as pa_module
+
+        pa = make_pa([
+            json.dumps({"type": "system", "subtype": "init"}),
+            json.dumps({"type": "user", "message": {"content": [
+                {"type": "tool_result", "content": "x" * 10000},
+            ]}}),
+            json.dumps({"type": "result"}),
+        ])
+
+        with patch.object(pa_module, "_json_loads", wraps=pa_module._json_loads) as loads:
+            events = list(pa._stream_claude("do it"))
+
+        assert [e.event_type for e in events] == [EventType.COMPLETED]
+        assert loads.call_count == 1
+
+    def test_enrichment_skipped_when_telemetry_disabled(self, make_pa):
+        pa = make_pa([
+            json.dumps({"type": "assistant", "message": {"content": [
+                {"type": "tool_use", "name": "Bash", "input": {"command": "ls"}},
+            ]}}),
+        ])
+
+        from agentproxy.telemetry import NoOpTelemetry
+
+        with patch("agentproxy.pa.get_telemetry", return_value=NoOpTelemetry()), \
+                patch.object(type(pa), "_process_tool_enrichments") as enrich:
+            list(pa._stream_claude("do it"))
+        enrich.assert_not_called()
+
+    def test_events_arrive_before_process_exits(self, make_pa, tmp_path):
+        release = tmp_path / "release"
+        pa = make_pa(
+            [
+                json.dumps({"type": "assistant", "message": {"content": [
+                    {"type": "text", "text": "first"},
+                ]}}),
+                json.dumps({"type": "result"}),
+            ],
+            wait_for=str(release),
+        )
+
+        stream = pa._stream_claude("do it")
+        first = next(stream)
+        # The first event was not held back until the script exited
+        assert first.content == "first"
+        assert not (tmp_path / "release.exited").exists()
+        release.touch()
+        assert [e.event_type for e in stream] == [EventType.COMPLETED]